@@ -1,5 +1,5 @@
 """API package exports."""
 
-from app.api.routes import router
+from app.api.routes import create_router
 
-__all__ = ["router"]
+__all__ = ["create_router"]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
+import orjson
 from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.engine.exceptions import PricingError
 
@@ -30,10 +33,28 @@ def build_error_payload(
     }
 
 
+# The 500 envelope never varies, so it is serialized once at import.
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    build_error_payload("INTERNAL_ERROR", "Internal server error")
+)
+
+
+def _json_response(
+    status_code: int, body: bytes, request_id: str | None
+) -> Response:
+    """Wrap a pre-serialized JSON body, echoing the request ID if known."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers={"X-Request-Id": request_id} if request_id else None,
+    )
+
+
 async def pricing_error_handler(
     request: Request,
     exc: PricingError,
-) -> JSONResponse:
+) -> Response:
     """Convert a domain pricing error into an HTTP response."""
     request_id = _get_request_id(request)
     logger.info(
@@ -45,38 +66,39 @@ async def pricing_error_handler(
             "request_id": request_id,
         },
     )
-    response = JSONResponse(
-        status_code=exc.status_code,
-        content=build_error_payload(exc.code, exc.message, exc.details),
+    body = orjson.dumps(
+        build_error_payload(exc.code, exc.message, exc.details)
     )
-    if request_id:
-        response.headers["X-Request-Id"] = request_id
-    return response
+    return _json_response(exc.status_code, body, request_id)
 
 
 async def validation_error_handler(
     request: Request,
     exc: RequestValidationError,
-) -> JSONResponse:
+) -> Response:
     """Return a normalized response for request validation failures."""
     request_id = _get_request_id(request)
-    response = JSONResponse(
-        status_code=400,
-        content=build_error_payload(
-            "INVALID_REQUEST",
-            "Request validation failed",
-            {"validation_errors": exc.errors()},
-        ),
+    payload = build_error_payload(
+        "INVALID_REQUEST",
+        "Request validation failed",
+        # Error contexts may carry exception objects; make them JSON-safe.
+        {"validation_errors": jsonable_encoder(exc.errors())},
     )
-    if request_id:
-        response.headers["X-Request-Id"] = request_id
-    return response
+    try:
+        body = orjson.dumps(payload)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits, which an error's ``input``
+        # can echo back from the request; the stdlib encoder does not.
+        body = json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+    return _json_response(400, body, request_id)
 
 
 async def internal_error_handler(
     request: Request,
     exc: Exception,
-) -> JSONResponse:
+) -> Response:
     """Return a generic internal error response without leaking details."""
     request_id = _get_request_id(request)
     logger.exception(
@@ -88,10 +110,4 @@ async def internal_error_handler(
             "request_id": request_id,
         },
     )
-    response = JSONResponse(
-        status_code=500,
-        content=build_error_payload("INTERNAL_ERROR", "Internal server error"),
-    )
-    if request_id:
-        response.headers["X-Request-Id"] = request_id
-    return response
+    return _json_response(500, _INTERNAL_ERROR_BODY, request_id)
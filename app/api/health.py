@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import orjson
+from starlette.types import Receive, Scope, Send
+
+from app.api.schemas import HealthResponse
+from app.engine import BillingEngine
+from app.pricing.repository import PricingRepository
+
+HEALTHZ_PATH = "/v1/healthz"
+
+
+class HealthCheck:
+    """Liveness/readiness probe served as a bare ASGI app.
+
+    Probes hit this endpoint every few seconds, so the JSON body is
+    serialized once and replayed instead of running the FastAPI request
+    and response pipeline per call.
+    """
+
+    def __init__(
+        self,
+        repository: PricingRepository,
+        engine: BillingEngine,
+    ) -> None:
+        """Serialize the probe body for the registry and engine in use."""
+        body = orjson.dumps(
+            HealthResponse(
+                status="ok",
+                pricing_version=repository.pricing_version,
+                engine_version=engine.engine_version,
+            ).model_dump()
+        )
+        self._body = body
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Send the prebuilt 200 response."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": self._headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": self._body})
@@ -1,37 +1,77 @@
 from __future__ import annotations
 
-import uuid
+import os
+import random
 
-from fastapi.responses import JSONResponse
-from starlette.middleware import base as middleware_base
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.errors import build_error_payload
 
 REQUEST_ID_HEADER = "X-Request-Id"
 
+_REQUEST_ID_HEADER_KEY = REQUEST_ID_HEADER.lower().encode("latin-1")
+_CHECKED_METHODS = frozenset({"POST", "PUT", "PATCH"})
 
-class RequestIdMiddleware(middleware_base.BaseHTTPMiddleware):
+# Request IDs only need to be unique, not unpredictable, so a PRNG seeded
+# once from the OS avoids a urandom syscall and UUID object per request.
+_request_id_rng = random.Random(os.urandom(32))
+
+
+def _reseed_request_id_rng() -> None:
+    _request_id_rng.seed(os.urandom(32))
+
+
+# Forked workers (e.g. gunicorn with --preload) must not share a sequence.
+os.register_at_fork(after_in_child=_reseed_request_id_rng)
+
+
+def _fast_request_id() -> str:
+    """Return a random 32-character hex request ID."""
+    return _request_id_rng.getrandbits(128).to_bytes(16, "big").hex()
+
+
+class RequestIdMiddleware:
     """Attach a unique request ID to every request and response."""
 
-    async def dispatch(
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application with request ID propagation."""
+        self.app = app
+
+    async def __call__(
         self,
-        request: Request,
-        call_next: middleware_base.RequestResponseEndpoint,
-    ) -> Response:
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
         """Attach or generate a request ID and set it on the response."""
-        header_request_id = request.headers.get(REQUEST_ID_HEADER)
-        request_id = header_request_id or str(uuid.uuid4())
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers[REQUEST_ID_HEADER] = request_id
-        return response
-
-
-def _payload_too_large(max_bytes: int, actual: int) -> JSONResponse:
-    return JSONResponse(
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_request_id = next(
+            (
+                value.decode("latin-1")
+                for key, value in scope["headers"]
+                if key == _REQUEST_ID_HEADER_KEY
+            ),
+            None,
+        )
+        request_id = header_request_id or _fast_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+def _payload_too_large(max_bytes: int, actual: int) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=413,
         content=build_error_payload(
             "INVALID_REQUEST",
@@ -41,7 +81,7 @@ def _payload_too_large(max_bytes: int, actual: int) -> JSONResponse:
     )
 
 
-def _parse_content_length(raw: str | None) -> int | None:
+def _parse_content_length(raw: bytes | None) -> int | None:
     if not raw:
         return None
     try:
@@ -50,38 +90,88 @@ def _parse_content_length(raw: str | None) -> int | None:
         return None
 
 
-class BodySizeLimitMiddleware(middleware_base.BaseHTTPMiddleware):
+class _BodyTooLarge(Exception):
+    def __init__(self, received: int) -> None:
+        """Signal that a streamed request body crossed the size limit."""
+        super().__init__(received)
+        self.received = received
+
+
+class BodySizeLimitMiddleware:
     def __init__(self, app: ASGIApp, max_body_bytes: int) -> None:
         """Create a middleware instance enforcing maximum request size."""
-        super().__init__(app)
+        self.app = app
         self._max_body_bytes = max_body_bytes
 
-    async def dispatch(
+    async def __call__(
         self,
-        request: Request,
-        call_next: middleware_base.RequestResponseEndpoint,
-    ) -> Response:
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
         """Reject over-sized API requests before they hit route handlers."""
-        if not self._should_check(request):
-            return await call_next(request)
-
-        cl = _parse_content_length(request.headers.get("content-length"))
-        if cl is not None and cl > self._max_body_bytes:
-            return _payload_too_large(self._max_body_bytes, cl)
-
-        body = await request.body()
-        if len(body) > self._max_body_bytes:
-            return _payload_too_large(self._max_body_bytes, len(body))
-
-        async def receive() -> dict[str, object]:
-            return {"type": "http.request", "body": body, "more_body": False}
-
-        return await call_next(Request(request.scope, receive))
+        if not self._should_check(scope):
+            await self.app(scope, receive, send)
+            return
+
+        cl = _parse_content_length(
+            next(
+                (
+                    value
+                    for key, value in scope["headers"]
+                    if key == b"content-length"
+                ),
+                None,
+            )
+        )
+        if cl is not None:
+            if cl > self._max_body_bytes:
+                response = _payload_too_large(self._max_body_bytes, cl)
+                await response(scope, receive, send)
+                return
+            # The ASGI server frames the body by Content-Length, so a
+            # declared in-limit size needs no further byte counting.
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self._max_body_bytes and not response_started:
+                    rejected = True
+                    raise _BodyTooLarge(received)
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            # Once the body is rejected, any response the app produces while
+            # unwinding is dropped in favour of the 413 sent below.
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+        if rejected:
+            response = _payload_too_large(self._max_body_bytes, received)
+            await response(scope, receive, send)
 
     @staticmethod
-    def _should_check(request: Request) -> bool:
-        return request.method in {
-            "POST",
-            "PUT",
-            "PATCH",
-        } and request.url.path.startswith("/v1/")
+    def _should_check(scope: Scope) -> bool:
+        return (
+            scope["type"] == "http"
+            and scope["method"] in _CHECKED_METHODS
+            and scope["path"].startswith("/v1/")
+        )
@@ -1,56 +1,56 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from decimal import Decimal
+from typing import Any
 
-from fastapi import APIRouter, Query, Request
+import orjson
+from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
 
 from app.api.schemas import (
-    BatchErrorItem,
     BatchEstimateRequest,
     BatchEstimateResponse,
-    BreakdownEntry,
-    ErrorBody,
-    EstimateMeta,
     EstimateRequest,
     EstimateResponse,
-    HealthResponse,
     ModelDetailResponse,
     ModelsResponse,
     ModelSummary,
-    PricingTierResponse,
-    ProvidersResponse,
-    ProviderSummary,
-    TotalCost,
-    VersionResponse,
 )
+from app.api.schemas import OverrideRatecard as OverrideRatecardPayload
+from app.api.schemas import ProvidersResponse, ProviderSummary, VersionResponse
 from app.engine import BillingEngine, OverrideRatecard, PricingError
 from app.engine.calculator import EstimateResult
 from app.pricing.models import Rate
 from app.pricing.repository import PricingRepository
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/v1")
 
+OverrideKey = tuple[str, tuple[tuple[str, str | None, str | None], ...]]
 
-def _get_repository(request: Request) -> PricingRepository:
-    return request.app.state.repository
+# Converted override ratecards shared by every request that repeats one.
+# Conversion does not depend on the registry, so apps can share them.
+_OVERRIDE_CACHE_SIZE = 1024
+_override_cache: dict[OverrideKey, OverrideRatecard] = {}
 
-
-def _get_engine(request: Request) -> BillingEngine:
-    return request.app.state.engine
+# The version only changes with a deployment, so clients may reuse it.
+_VERSIONS_HEADERS = {"Cache-Control": "public, max-age=60"}
 
 
 def _to_decimal_string(value: Decimal) -> str:
-    return format(value, "f")
-
+    # ``str`` is the cheap path and already matches ``format(value, "f")``
+    # unless it switches to exponent notation.
+    text = str(value)
+    return format(value, "f") if "E" in text else text
 
-def _to_override_ratecard(payload: EstimateRequest) -> OverrideRatecard | None:
-    if payload.overrides.ratecard is None:
-        return None
 
+def _convert_override_ratecard(
+    ratecard: OverrideRatecardPayload,
+) -> OverrideRatecard:
     billable: dict[str, Rate] = {}
-    for dimension, spec in payload.overrides.ratecard.billable.items():
+    for dimension, spec in ratecard.billable.items():
         if spec.per_1m is not None:
             raw_value = _to_decimal_string(spec.per_1m)
             billable[dimension] = Rate(
@@ -68,221 +68,358 @@ def _to_override_ratecard(payload: EstimateRequest) -> OverrideRatecard | None:
                 f"RateSpec for '{dimension}' has neither per_1m nor per_unit"
             )
 
-    return OverrideRatecard(
-        currency=payload.overrides.ratecard.currency, billable=billable
-    )
+    return OverrideRatecard(currency=ratecard.currency, billable=billable)
 
 
-def _estimate_response_from_result(result: EstimateResult) -> EstimateResponse:
-    return EstimateResponse(
-        pricing_version=result.pricing_version,
-        provider=result.provider,
-        model=result.model,
-        breakdown=[
-            BreakdownEntry(
-                dimension=item.dimension,
-                quantity=item.quantity,
-                rate=item.rate,
-                cost=item.cost,
-            )
-            for item in result.breakdown
-        ],
-        total=TotalCost(currency=result.currency, cost=result.total_cost),
-        warnings=result.warnings,
-        meta=EstimateMeta(
-            computed_at=result.computed_at,
-            engine_version=result.engine_version,
-        ),
+def _override_cache_key(ratecard: OverrideRatecardPayload) -> OverrideKey:
+    # ``str`` keeps the exponent, so ``1.0`` and ``1`` stay distinct and each
+    # cached Rate still echoes the caller's own ``raw`` representation.
+    return ratecard.currency, tuple(
+        (
+            dimension,
+            None if spec.per_1m is None else str(spec.per_1m),
+            None if spec.per_unit is None else str(spec.per_unit),
+        )
+        for dimension, spec in ratecard.billable.items()
     )
 
 
-@router.post("/estimate", response_model=EstimateResponse)
-def estimate(payload: EstimateRequest, request: Request) -> EstimateResponse:
-    """Estimate a single request cost using registry or override pricing."""
-    engine = _get_engine(request)
-    logger.info(
-        "estimate_requested",
-        extra={
-            "event": "estimate_requested",
-            "provider": payload.provider,
-            "model": payload.model,
+def _to_override_ratecard(payload: EstimateRequest) -> OverrideRatecard | None:
+    ratecard = payload.overrides.ratecard
+    if ratecard is None:
+        return None
+
+    key = _override_cache_key(ratecard)
+    override = _override_cache.get(key)
+    if override is None:
+        override = _convert_override_ratecard(ratecard)
+        # Cleared when full rather than evicting one entry, so request
+        # threads can share it without a lock.
+        if len(_override_cache) >= _OVERRIDE_CACHE_SIZE:
+            _override_cache.clear()
+        _override_cache[key] = override
+    return override
+
+
+def _estimate_payload(result: EstimateResult) -> dict[str, Any]:
+    # Mirrors EstimateResponse; engine output needs no re-validation.
+    return {
+        "pricing_version": result.pricing_version,
+        "provider": result.provider,
+        "model": result.model,
+        "breakdown": [
+            {
+                "dimension": item.dimension,
+                "quantity": item.quantity,
+                "rate": item.rate,
+                "cost": item.cost,
+            }
+            for item in result.breakdown
+        ],
+        "total": {"currency": result.currency, "cost": result.total_cost},
+        "warnings": result.warnings,
+        "meta": {
+            "computed_at": result.computed_at,
+            "engine_version": result.engine_version,
         },
-    )
+    }
+
+
+class _V1Handlers:
+    """The ``/v1`` endpoints, bound to one app's repository and engine.
+
+    Handlers read their services from the instance rather than walking
+    ``request.app.state`` on every call, and each app gets its own
+    instance, so two apps in one process never share a registry.
+    """
+
+    def __init__(
+        self, repository: PricingRepository, engine: BillingEngine
+    ) -> None:
+        """Bind the handlers to the services of a single app."""
+        self._repository = repository
+        self._engine = engine
+        # Serialized listing bodies, keyed by route and query variant.
+        # Registry content is fixed per app, so each variant is encoded
+        # only once.
+        self._listing_cache: dict[tuple[str, ...], bytes] = {}
+
+    def _cached_listing(
+        self,
+        key: tuple[str, ...],
+        build: Callable[[], BaseModel],
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        body = self._listing_cache.get(key)
+        if body is None:
+            body = orjson.dumps(build().model_dump(mode="json"))
+            self._listing_cache[key] = body
+        # A fresh Response per request: FastAPI attaches per-request state
+        # such as ``background`` to the returned object, so it can't be
+        # shared.
+        return Response(
+            content=body, media_type="application/json", headers=headers
+        )
 
-    result = engine.estimate(
-        provider=payload.provider,
-        model=payload.model,
-        usage=payload.usage,
-        mode=payload.options.mode,
-        pricing_version=payload.options.pricing_version,
-        override_ratecard=_to_override_ratecard(payload),
-    )
+    def estimate(self, payload: EstimateRequest) -> ORJSONResponse:
+        """Estimate a single request cost with registry or override pricing."""
+        logger.info(
+            "estimate_requested",
+            extra={
+                "event": "estimate_requested",
+                "provider": payload.provider,
+                "model": payload.model,
+            },
+        )
 
-    return _estimate_response_from_result(result)
-
-
-@router.post("/estimate/batch", response_model=BatchEstimateResponse)
-def estimate_batch(
-    payload: BatchEstimateRequest, request: Request
-) -> BatchEstimateResponse:
-    """Estimate costs for a batch and return partial successes."""
-    repository = _get_repository(request)
-    engine = _get_engine(request)
-
-    results: list[EstimateResponse] = []
-    errors: list[BatchErrorItem] = []
-
-    for index, item in enumerate(payload.items):
-        try:
-            result = engine.estimate(
-                provider=item.provider,
-                model=item.model,
-                usage=item.usage,
-                mode=item.options.mode,
-                pricing_version=item.options.pricing_version,
-                override_ratecard=_to_override_ratecard(item),
-            )
-        except PricingError as exc:
-            errors.append(
-                BatchErrorItem(
-                    index=index,
-                    error=ErrorBody(
-                        code=exc.code, message=exc.message, details=exc.details
-                    ),
+        result = self._engine.estimate(
+            provider=payload.provider,
+            model=payload.model,
+            usage=payload.usage,
+            mode=payload.options.mode,
+            pricing_version=payload.options.pricing_version,
+            override_ratecard=_to_override_ratecard(payload),
+        )
+
+        return ORJSONResponse(_estimate_payload(result))
+
+    def estimate_batch(self, payload: BatchEstimateRequest) -> ORJSONResponse:
+        """Estimate costs for a batch and return partial successes."""
+        engine = self._engine
+
+        outcomes: dict[int, EstimateResult | PricingError] = {}
+        # Registry items sharing a lookup key are priced together so the
+        # provider/model resolution runs once per group, not once per item.
+        groups: dict[tuple[str, str, str, str], list[int]] = {}
+
+        for index, item in enumerate(payload.items):
+            override = _to_override_ratecard(item)
+            if override is None:
+                key = (
+                    item.provider,
+                    item.model,
+                    item.options.pricing_version,
+                    item.options.mode,
+                )
+                groups.setdefault(key, []).append(index)
+                continue
+
+            try:
+                outcomes[index] = engine.estimate(
+                    provider=item.provider,
+                    model=item.model,
+                    usage=item.usage,
+                    mode=item.options.mode,
+                    pricing_version=item.options.pricing_version,
+                    override_ratecard=override,
                 )
+            except PricingError as exc:
+                outcomes[index] = exc
+
+        for (
+            provider,
+            model,
+            pricing_version,
+            mode,
+        ), indexes in groups.items():
+            group_outcomes = engine.estimate_many(
+                provider=provider,
+                model=model,
+                usages=[payload.items[index].usage for index in indexes],
+                mode=mode,
+                pricing_version=pricing_version,
             )
-            continue
-
-        results.append(_estimate_response_from_result(result))
+            outcomes.update(zip(indexes, group_outcomes))
+
+        results: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for index in range(len(payload.items)):
+            outcome = outcomes[index]
+            if isinstance(outcome, PricingError):
+                errors.append(
+                    {
+                        "index": index,
+                        "error": {
+                            "code": outcome.code,
+                            "message": outcome.message,
+                            "details": outcome.details,
+                        },
+                    }
+                )
+            else:
+                results.append(_estimate_payload(outcome))
 
-    return BatchEstimateResponse(
-        pricing_version=repository.pricing_version,
-        results=results,
-        errors=errors,
-    )
+        return ORJSONResponse(
+            {
+                "pricing_version": self._repository.pricing_version,
+                "results": results,
+                "errors": errors,
+            }
+        )
 
+    def list_providers(self) -> Response:
+        """List available providers with model counts and capabilities."""
+        return self._cached_listing(("providers",), self._build_providers)
 
-@router.get("/providers", response_model=ProvidersResponse)
-def list_providers(request: Request) -> ProvidersResponse:
-    """List available providers with model counts and capabilities."""
-    repository = _get_repository(request)
+    def _build_providers(self) -> ProvidersResponse:
+        repository = self._repository
 
-    providers: list[ProviderSummary] = []
-    for provider_name in repository.list_providers():
-        provider = repository.get_provider(provider_name)
-        if provider is None:
-            continue
+        providers: list[ProviderSummary] = []
+        for provider_name in repository.list_providers():
+            provider = repository.get_provider(provider_name)
+            if provider is None:
+                continue
 
-        capabilities = sorted(
-            {
-                capability
-                for model in provider.models.values()
-                for capability in model.capabilities
-            }
-        )
-        providers.append(
-            ProviderSummary(
-                provider=provider.provider,
-                model_count=len(provider.models),
-                capabilities=capabilities,
+            providers.append(
+                ProviderSummary.model_construct(
+                    provider=provider.provider,
+                    model_count=len(provider.models),
+                    capabilities=provider.capabilities,
+                )
             )
-        )
 
-    return ProvidersResponse(
-        pricing_version=repository.pricing_version, providers=providers
-    )
+        return ProvidersResponse.model_construct(
+            pricing_version=repository.pricing_version, providers=providers
+        )
 
+    def list_models(
+        self,
+        provider: str = Query(..., min_length=1),
+        include_rates: bool = Query(False),
+    ) -> Response:
+        """List models for a provider with optional billable rate details."""
+        provider_data = self._repository.get_provider(provider)
+        if provider_data is None:
+            raise PricingError(
+                "PROVIDER_NOT_SUPPORTED",
+                "Provider not supported",
+                details={"provider": provider},
+            )
 
-@router.get("/models", response_model=ModelsResponse)
-def list_models(
-    request: Request,
-    provider: str = Query(..., min_length=1),
-    include_rates: bool = Query(False),
-) -> ModelsResponse:
-    """List models for a provider with optional billable rate details."""
-    repository = _get_repository(request)
-    provider_data = repository.get_provider(provider)
-    if provider_data is None:
-        raise PricingError(
-            "PROVIDER_NOT_SUPPORTED",
-            "Provider not supported",
-            details={"provider": provider},
+        # Only known provider spellings reach the cache, which bounds its
+        # size.
+        return self._cached_listing(
+            ("models", provider, str(include_rates)),
+            lambda: self._build_models(provider, include_rates),
         )
 
-    models: list[ModelSummary] = []
-    for model in repository.list_models(provider):
-        models.append(
-            ModelSummary(
-                model=model.model,
-                effective_from=model.effective_from,
-                capabilities=list(model.capabilities),
-                metadata=model.metadata or None,
-                billable=(
-                    repository.serialize_billable(model.billable)
-                    if include_rates
-                    else None
-                ),
+    def _build_models(
+        self, provider: str, include_rates: bool
+    ) -> ModelsResponse:
+        repository = self._repository
+        models: list[ModelSummary] = []
+        for model in repository.list_models(provider):
+            models.append(
+                ModelSummary.model_construct(
+                    model=model.model,
+                    effective_from=model.effective_from,
+                    capabilities=model.capabilities,
+                    metadata=model.metadata or None,
+                    billable=(
+                        repository.serialize_billable(model.billable)
+                        if include_rates
+                        else None
+                    ),
+                )
             )
-        )
 
-    return ModelsResponse(
-        pricing_version=repository.pricing_version,
-        provider=provider,
-        models=models,
-    )
+        return ModelsResponse.model_construct(
+            pricing_version=repository.pricing_version,
+            provider=provider,
+            models=models,
+        )
 
+    def get_model(self, provider: str, model: str) -> ORJSONResponse:
+        """Return full pricing details for a single model."""
+        repository = self._repository
+        model_data = repository.get_model(provider, model)
+        if model_data is None:
+            raise PricingError(
+                "MODEL_NOT_FOUND",
+                "Model not found",
+                details={"provider": provider, "model": model},
+            )
 
-@router.get("/models/{provider}/{model}", response_model=ModelDetailResponse)
-def get_model(
-    provider: str, model: str, request: Request
-) -> ModelDetailResponse:
-    """Return full pricing details for a single model."""
-    repository = _get_repository(request)
-    model_data = repository.get_model(provider, model)
-    if model_data is None:
-        raise PricingError(
-            "MODEL_NOT_FOUND",
-            "Model not found",
-            details={"provider": provider, "model": model},
+        # Mirrors ModelDetailResponse; registry data needs no re-validation.
+        return ORJSONResponse(
+            {
+                "pricing_version": repository.pricing_version,
+                "provider": repository.resolve_provider(provider),
+                "model": model_data.model,
+                "effective_from": model_data.effective_from,
+                "capabilities": model_data.capabilities,
+                "metadata": model_data.metadata or None,
+                "billable": repository.serialize_billable(model_data.billable),
+                "pricing_tiers": [
+                    {
+                        "condition": {
+                            "dimension": tier.condition.dimension,
+                            "gt": tier.condition.gt,
+                        },
+                        "billable": repository.serialize_billable(
+                            tier.billable
+                        ),
+                    }
+                    for tier in model_data.pricing_tiers
+                ],
+            }
         )
 
-    tiers = [
-        PricingTierResponse(
-            condition={
-                "dimension": t.condition.dimension,
-                "gt": t.condition.gt,
-            },
-            billable=repository.serialize_billable(t.billable),
+    def get_versions(self) -> Response:
+        """Return the active pricing version for this deployment."""
+        return self._cached_listing(
+            ("versions",),
+            lambda: VersionResponse(
+                pricing_version=self._repository.pricing_version
+            ),
+            headers=_VERSIONS_HEADERS,
         )
-        for t in model_data.pricing_tiers
-    ]
-
-    return ModelDetailResponse(
-        pricing_version=repository.pricing_version,
-        provider=repository.resolve_provider(provider),
-        model=model_data.model,
-        effective_from=model_data.effective_from,
-        capabilities=list(model_data.capabilities),
-        metadata=model_data.metadata or None,
-        billable=repository.serialize_billable(model_data.billable),
-        pricing_tiers=tiers,
-    )
 
 
-@router.get("/versions", response_model=VersionResponse)
-def get_versions(request: Request) -> VersionResponse:
-    """Return the active pricing version for this deployment."""
-    repository = _get_repository(request)
-    return VersionResponse(pricing_version=repository.pricing_version)
-
-
-@router.get("/healthz", response_model=HealthResponse, include_in_schema=False)
-def healthz(request: Request) -> HealthResponse:
-    """Liveness/readiness probe — returns 200 when the app is ready."""
-    repository = _get_repository(request)
-    engine = _get_engine(request)
-    return HealthResponse(
-        status="ok",
-        pricing_version=repository.pricing_version,
-        engine_version=engine.engine_version,
+def create_router(
+    repository: PricingRepository, engine: BillingEngine
+) -> APIRouter:
+    """Build the ``/v1`` router serving one repository and engine."""
+    handlers = _V1Handlers(repository, engine)
+    router = APIRouter(prefix="/v1", default_response_class=ORJSONResponse)
+
+    # The hot estimate routes return pre-built ORJSONResponse payloads and
+    # the listing routes serve cached bytes; the response models are kept
+    # for the OpenAPI schema only.
+    router.add_api_route(
+        "/estimate",
+        handlers.estimate,
+        methods=["POST"],
+        responses={200: {"model": EstimateResponse}},
+    )
+    router.add_api_route(
+        "/estimate/batch",
+        handlers.estimate_batch,
+        methods=["POST"],
+        responses={200: {"model": BatchEstimateResponse}},
+    )
+    router.add_api_route(
+        "/providers",
+        handlers.list_providers,
+        methods=["GET"],
+        responses={200: {"model": ProvidersResponse}},
+    )
+    router.add_api_route(
+        "/models",
+        handlers.list_models,
+        methods=["GET"],
+        responses={200: {"model": ModelsResponse}},
+    )
+    router.add_api_route(
+        "/models/{provider}/{model}",
+        handlers.get_model,
+        methods=["GET"],
+        responses={200: {"model": ModelDetailResponse}},
+    )
+    router.add_api_route(
+        "/versions",
+        handlers.get_versions,
+        methods=["GET"],
+        responses={200: {"model": VersionResponse}},
     )
+    return router
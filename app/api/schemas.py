@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, get_args
 
 import pydantic
 from pydantic import BaseModel, ConfigDict, Field
@@ -11,62 +11,86 @@ from app.constants import (
     MAX_DIMENSION_QUANTITY,
     SUPPORTED_BILLABLE_DIMENSIONS,
 )
+from app.pricing.models import check_rate_bounds
+
+# Bounded like ``Rate`` so extreme exponents fail validation up front.
+NonNegativeDecimal = Annotated[
+    Decimal, Field(ge=0), pydantic.AfterValidator(check_rate_bounds)
+]
+UsageDimension = Annotated[str, Field(min_length=1)]
+# Spelled out for type checkers; the guard below keeps it in step with the
+# engine's runtime set.
+BillableDimension = Literal[
+    "audio_input_seconds",
+    "audio_output_seconds",
+    "embedding_tokens",
+    "image_count",
+    "image_megapixels",
+    "input_tokens_cached",
+    "input_tokens_uncached",
+    "output_tokens",
+    "reasoning_tokens",
+    "requests",
+    "tool_calls",
+]
+if frozenset(get_args(BillableDimension)) != SUPPORTED_BILLABLE_DIMENSIONS:
+    raise RuntimeError(
+        "BillableDimension is out of sync with SUPPORTED_BILLABLE_DIMENSIONS"
+    )
+# ``strict`` rejects bools, floats and numeric strings during parsing.
+UsageQuantity = Annotated[
+    int, Field(ge=0, le=MAX_DIMENSION_QUANTITY, strict=True)
+]
 
 
-class RateSpec(BaseModel):
+class _RateSpecBase(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
-    per_1m: Decimal | None = None
-    per_unit: Decimal | None = None
 
-    @pydantic.model_validator(mode="after")
-    def validate_rate(self) -> "RateSpec":
-        """Ensure exactly one non-negative rate field is provided."""
-        has_per_1m = self.per_1m is not None
-        has_per_unit = self.per_unit is not None
+class RatePer1M(_RateSpecBase):
+    per_1m: NonNegativeDecimal
+    per_unit: None = None
+
+
+class RatePerUnit(_RateSpecBase):
+    per_1m: None = None
+    per_unit: NonNegativeDecimal
+
 
-        if has_per_1m == has_per_unit:
-            message = "Exactly one of per_1m or " "per_unit must be provided"
-            raise ValueError(message)
+def _rate_spec_tag(data: Any) -> str | None:
+    if isinstance(data, dict):
+        if data.get("per_1m") is not None:
+            return "per_1m"
+        if data.get("per_unit") is not None:
+            return "per_unit"
+        return None
+    if isinstance(data, RatePer1M):
+        return "per_1m"
+    if isinstance(data, RatePerUnit):
+        return "per_unit"
+    return None
 
-        value = self.per_1m if has_per_1m else self.per_unit
-        if value is not None and value < 0:
-            raise ValueError("Rate values must be >= 0")
 
-        return self
+# Tagged by whichever rate field is set (an explicit null counts as unset),
+# so a bad value is reported against that one member only.
+RateSpec = Annotated[
+    Annotated[RatePer1M, pydantic.Tag("per_1m")]
+    | Annotated[RatePerUnit, pydantic.Tag("per_unit")],
+    pydantic.Discriminator(
+        _rate_spec_tag,
+        custom_error_type="invalid_rate_spec",
+        custom_error_message="Rate must set exactly one of per_1m or per_unit",
+    ),
+]
 
 
 class OverrideRatecard(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     currency: str = "USD"
-    billable: dict[str, RateSpec]
-
-    @pydantic.field_validator("billable")
-    @classmethod
-    def validate_billable_dimensions(
-        cls: type["OverrideRatecard"],
-        value: dict[str, RateSpec],
-    ) -> dict[str, RateSpec]:
-        """Validate override dimensions against supported billable keys."""
-        if not value:
-            message = "Override ratecard billable map must not be empty"
-            raise ValueError(message)
-
-        invalid_dimensions = sorted(
-            dimension
-            for dimension in value
-            if dimension not in SUPPORTED_BILLABLE_DIMENSIONS
-        )
-        if invalid_dimensions:
-            raise ValueError(
-                (
-                    "Unsupported billable dimensions in overrides: "
-                    f"{invalid_dimensions}"
-                )
-            )
-
-        return value
+    # Unknown override dimensions are rejected by pydantic-core's literal
+    # matcher while the keys are parsed.
+    billable: Annotated[dict[BillableDimension, RateSpec], Field(min_length=1)]
 
 
 class EstimateOverrides(BaseModel):
@@ -87,34 +111,10 @@ class EstimateRequest(BaseModel):
 
     provider: str = Field(min_length=1)
     model: str = Field(min_length=1)
-    usage: dict[str, int] = Field(min_length=1)
+    usage: dict[UsageDimension, UsageQuantity] = Field(min_length=1)
     options: EstimateOptions = Field(default_factory=EstimateOptions)
     overrides: EstimateOverrides = Field(default_factory=EstimateOverrides)
 
-    @pydantic.field_validator("usage")
-    @classmethod
-    def validate_usage(
-        cls: type["EstimateRequest"],
-        value: dict[str, int],
-    ) -> dict[str, int]:
-        """Validate usage map structure and dimension quantity bounds."""
-        for dimension, quantity in value.items():
-            if not isinstance(dimension, str) or not dimension:
-                raise ValueError("Usage dimensions must be non-empty strings")
-
-            if isinstance(quantity, bool) or not isinstance(quantity, int):
-                raise ValueError("Usage quantities must be integers")
-
-            if quantity < 0 or quantity > MAX_DIMENSION_QUANTITY:
-                raise ValueError(
-                    (
-                        f"Usage quantity for '{dimension}' must be between 0 "
-                        f"and {MAX_DIMENSION_QUANTITY}"
-                    )
-                )
-
-        return value
-
 
 class BatchEstimateRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -194,7 +194,7 @@ class ProviderSummary(BaseModel):
 
     provider: str
     model_count: int
-    capabilities: list[str]
+    capabilities: tuple[str, ...]
 
 
 class ProvidersResponse(BaseModel):
@@ -209,7 +209,7 @@ class ModelSummary(BaseModel):
 
     model: str
     effective_from: str
-    capabilities: list[str]
+    capabilities: tuple[str, ...]
     metadata: dict[str, Any] | None = None
     billable: dict[str, dict[str, str]] | None = None
 
@@ -236,7 +236,7 @@ class ModelDetailResponse(BaseModel):
     provider: str
     model: str
     effective_from: str
-    capabilities: list[str]
+    capabilities: tuple[str, ...]
     metadata: dict[str, Any] | None = None
     billable: dict[str, dict[str, str]]
     pricing_tiers: list[PricingTierResponse]
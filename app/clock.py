@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+# (epoch second, formatted timestamp); swapped as a single tuple so
+# concurrent readers never see a second paired with another's string.
+_iso_cache: tuple[int, str] = (-1, "")
+
+
+def iso_now() -> str:
+    """Return the current UTC time as an ISO 8601 string, to the second."""
+    global _iso_cache
+    now = int(time.time())
+    cached_second, cached_value = _iso_cache
+    if now == cached_second:
+        return cached_value
+    value = datetime.fromtimestamp(now, UTC).isoformat()
+    _iso_cache = (now, value)
+    return value
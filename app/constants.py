@@ -1,17 +1,23 @@
-SUPPORTED_BILLABLE_DIMENSIONS = {
-    "input_tokens_uncached",
-    "input_tokens_cached",
-    "output_tokens",
-    "reasoning_tokens",
-    "embedding_tokens",
-    "tool_calls",
-    "image_count",
-    "image_megapixels",
-    "audio_input_seconds",
-    "audio_output_seconds",
-    "requests",
-}
+SUPPORTED_BILLABLE_DIMENSIONS = frozenset(
+    {
+        "input_tokens_uncached",
+        "input_tokens_cached",
+        "output_tokens",
+        "reasoning_tokens",
+        "embedding_tokens",
+        "tool_calls",
+        "image_count",
+        "image_megapixels",
+        "audio_input_seconds",
+        "audio_output_seconds",
+        "requests",
+    }
+)
 
 MAX_DIMENSION_QUANTITY = 10_000_000_000
+# Bounds on a rate's decimal form (``Decimal.as_tuple``), which keep the
+# engine's exact integer cost arithmetic small for any client-sent rate.
+MAX_RATE_DIGITS = 30
+MAX_RATE_EXPONENT = 30
 MAX_BATCH_SIZE = 100
 MAX_REQUEST_BODY_BYTES = 1_048_576
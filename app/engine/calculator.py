@@ -1,25 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime
-from decimal import ROUND_HALF_UP, Decimal
 
+from app.clock import iso_now
 from app.constants import MAX_DIMENSION_QUANTITY, SUPPORTED_BILLABLE_DIMENSIONS
 from app.engine.exceptions import PricingError
-from app.pricing.models import Rate
+from app.pricing.models import ModelPricing, Rate
 from app.pricing.repository import PricingRepository
 
-COST_QUANTIZER = Decimal("0.000001")
-ONE_MILLION = Decimal("1000000")
+# Costs are reported with six decimal places (micro-units of currency).
+COST_SCALE = 6
+# Usage is priced in this fixed order instead of sorting each request.
+_DIMENSION_ORDER = tuple(sorted(SUPPORTED_BILLABLE_DIMENSIONS))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OverrideRatecard:
     currency: str
     billable: dict[str, Rate]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BreakdownItem:
     dimension: str
     quantity: int
@@ -27,7 +28,7 @@ class BreakdownItem:
     cost: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EstimateResult:
     pricing_version: str
     provider: str
@@ -49,6 +50,12 @@ class BillingEngine:
         """Build a deterministic billing engine."""
         self._repository = repository
         self._engine_version = engine_version
+        # Registry metadata is fixed for the repository's lifetime.
+        self._pricing_version = repository.pricing_version
+        self._currency = repository.currency
+        self._valid_pricing_versions = frozenset(
+            {"latest", repository.pricing_version}
+        )
 
     @property
     def engine_version(self) -> str:
@@ -70,125 +77,211 @@ class BillingEngine:
         self._validate_mode(mode)
         self._validate_usage(usage)
 
-        resolved_model, rate_map, tier_warning = self._resolve_rate_map(
+        if override_ratecard is not None:
+            self._validate_override_currency(override_ratecard)
+            return self._price(
+                provider=provider,
+                model=model,
+                usage=usage,
+                mode=mode,
+                rate_map=override_ratecard.billable,
+                tier_warning=None,
+            )
+
+        resolved_model, model_data = self._resolve_model(provider, model)
+        rate_map, tier_warning = self._resolve_rate_map(model_data, usage)
+        return self._price(
             provider=provider,
-            model=model,
+            model=resolved_model,
             usage=usage,
-            override_ratecard=override_ratecard,
+            mode=mode,
+            rate_map=rate_map,
+            tier_warning=tier_warning,
         )
 
-        total_raw = Decimal("0")
+    def estimate_many(
+        self,
+        *,
+        provider: str,
+        model: str,
+        usages: list[dict[str, int]],
+        mode: str = "strict",
+        pricing_version: str = "latest",
+    ) -> list[EstimateResult | PricingError]:
+        """Estimate several usage payloads for one registry provider/model.
+
+        The provider and model are resolved once for the whole group. The
+        outcome for each usage is either its result or the error that
+        ``estimate`` would have raised for it, in input order.
+        """
+        try:
+            self._validate_pricing_version(pricing_version)
+            self._validate_mode(mode)
+        except PricingError as exc:
+            return [exc for _ in usages]
+
+        resolution: tuple[str, ModelPricing] | PricingError
+        try:
+            resolution = self._resolve_model(provider, model)
+        except PricingError as exc:
+            resolution = exc
+
+        outcomes: list[EstimateResult | PricingError] = []
+        for usage in usages:
+            try:
+                self._validate_usage(usage)
+                if isinstance(resolution, PricingError):
+                    outcomes.append(resolution)
+                    continue
+
+                resolved_model, model_data = resolution
+                rate_map, tier_warning = self._resolve_rate_map(
+                    model_data, usage
+                )
+                outcomes.append(
+                    self._price(
+                        provider=provider,
+                        model=resolved_model,
+                        usage=usage,
+                        mode=mode,
+                        rate_map=rate_map,
+                        tier_warning=tier_warning,
+                    )
+                )
+            except PricingError as exc:
+                outcomes.append(exc)
+
+        return outcomes
+
+    def _price(
+        self,
+        *,
+        provider: str,
+        model: str,
+        usage: dict[str, int],
+        mode: str,
+        rate_map: dict[str, Rate],
+        tier_warning: str | None,
+    ) -> EstimateResult:
         warnings: list[str] = []
         if tier_warning:
             warnings.append(tier_warning)
-        breakdown: list[BreakdownItem] = []
-
-        for dimension in sorted(usage):
-            quantity = usage[dimension]
-            if quantity == 0:
-                continue
 
-            if dimension not in SUPPORTED_BILLABLE_DIMENSIONS:
+        # Settle unsupported dimensions before any cost arithmetic, so a
+        # strict-mode rejection costs only the dict lookups below. Fully
+        # priced usage passes both subset tests and skips the scan.
+        usage_keys = usage.keys()
+        if not (
+            usage_keys <= rate_map.keys()
+            and usage_keys <= SUPPORTED_BILLABLE_DIMENSIONS
+        ):
+            unpriced = sorted(
+                dimension
+                for dimension, quantity in usage.items()
+                if quantity
+                and (
+                    dimension not in rate_map
+                    or dimension not in SUPPORTED_BILLABLE_DIMENSIONS
+                )
+            )
+            for dimension in unpriced:
                 self._handle_unsupported_dimension(
                     mode=mode,
                     provider=provider,
-                    model=resolved_model,
+                    model=model,
                     dimension=dimension,
                     warnings=warnings,
                 )
+
+        # Exact running total of ``total_units * 10 ** -total_scale``.
+        total_units = 0
+        total_scale = 0
+        breakdown: list[BreakdownItem] = []
+        for dimension in _DIMENSION_ORDER:
+            quantity = usage.get(dimension)
+            if not quantity:
                 continue
 
             rate = rate_map.get(dimension)
             if rate is None:
-                self._handle_unsupported_dimension(
-                    mode=mode,
-                    provider=provider,
-                    model=resolved_model,
-                    dimension=dimension,
-                    warnings=warnings,
-                )
                 continue
 
-            cost_raw = self._compute_cost(quantity=quantity, rate=rate)
-            total_raw += cost_raw
+            cost_units = self._compute_cost(quantity=quantity, rate=rate)
+            if rate.scale > total_scale:
+                total_units *= 10 ** (rate.scale - total_scale)
+                total_scale = rate.scale
+            total_units += cost_units * 10 ** (total_scale - rate.scale)
             breakdown.append(
                 BreakdownItem(
                     dimension=dimension,
                     quantity=quantity,
                     rate=rate.raw,
-                    cost=self._to_fixed_6(cost_raw),
+                    cost=self._to_fixed_6(cost_units, rate.scale),
                 )
             )
 
-        total_cost = self._to_fixed_6(total_raw)
+        total_cost = self._to_fixed_6(total_units, total_scale)
 
         return EstimateResult(
-            pricing_version=self._repository.pricing_version,
+            pricing_version=self._pricing_version,
             provider=provider,
-            model=resolved_model,
+            model=model,
             breakdown=breakdown,
-            currency=self._repository.currency,
+            currency=self._currency,
             total_cost=total_cost,
             warnings=warnings,
-            computed_at=datetime.now(UTC).isoformat(),
+            computed_at=iso_now(),
             engine_version=self._engine_version,
         )
 
-    def _resolve_rate_map(
-        self,
-        *,
-        provider: str,
-        model: str,
-        usage: dict[str, int],
-        override_ratecard: OverrideRatecard | None,
-    ) -> tuple[str, dict[str, Rate], str | None]:
-        if override_ratecard is not None:
-            if override_ratecard.currency != self._repository.currency:
-                raise PricingError(
-                    "INVALID_REQUEST",
-                    f"Override currency must be {self._repository.currency}",
-                    details={"currency": override_ratecard.currency},
-                )
-            return model, override_ratecard.billable, None
+    def _validate_override_currency(
+        self, override_ratecard: OverrideRatecard
+    ) -> None:
+        if override_ratecard.currency != self._currency:
+            raise PricingError(
+                "INVALID_REQUEST",
+                f"Override currency must be {self._currency}",
+                details={"currency": override_ratecard.currency},
+            )
+
+    def _resolve_model(
+        self, provider: str, model: str
+    ) -> tuple[str, ModelPricing]:
+        model_data = self._repository.get_model(provider, model)
+        if model_data is not None:
+            return model_data.model, model_data
 
-        provider_data = self._repository.get_provider(provider)
-        if provider_data is None:
+        if self._repository.get_provider(provider) is None:
             raise PricingError(
                 "PROVIDER_NOT_SUPPORTED",
                 "Provider not supported",
                 details={"provider": provider},
             )
+        raise PricingError(
+            "MODEL_NOT_FOUND",
+            "Model not found",
+            details={"provider": provider, "model": model},
+        )
 
-        resolved_model = self._repository.resolve_model(provider, model)
-        model_data = provider_data.models.get(resolved_model)
-        if model_data is None:
-            raise PricingError(
-                "MODEL_NOT_FOUND",
-                "Model not found",
-                details={"provider": provider, "model": model},
-            )
-
+    def _resolve_rate_map(
+        self,
+        model_data: ModelPricing,
+        usage: dict[str, int],
+    ) -> tuple[dict[str, Rate], str | None]:
         rate_map = model_data.billable
         tier_warning: str | None = None
 
-        if model_data.pricing_tiers:
-            for tier in sorted(
-                model_data.pricing_tiers,
-                key=lambda t: t.condition.gt,
-                reverse=True,
-            ):
-                value = self._resolve_dimension(
-                    tier.condition.dimension, usage
+        for tier in model_data.tiers_by_threshold:
+            value = self._resolve_dimension(tier.condition.dimension, usage)
+            if value > tier.condition.gt:
+                rate_map = tier.billable
+                tier_warning = (
+                    f"Pricing tier applied: {tier.condition.dimension} "
+                    f"{value} > {tier.condition.gt}."
                 )
-                if value > tier.condition.gt:
-                    rate_map = tier.billable
-                    tier_warning = (
-                        f"Pricing tier applied: {tier.condition.dimension} "
-                        f"{value} > {tier.condition.gt}."
-                    )
-                    break
+                break
 
-        return resolved_model, rate_map, tier_warning
+        return rate_map, tier_warning
 
     @staticmethod
     def _resolve_dimension(dimension: str, usage: dict[str, int]) -> int:
@@ -199,16 +292,27 @@ class BillingEngine:
         return usage.get(dimension, 0)
 
     @staticmethod
-    def _compute_cost(*, quantity: int, rate: Rate) -> Decimal:
-        quantity_decimal = Decimal(quantity)
-        if rate.kind == "per_1m":
-            return (quantity_decimal / ONE_MILLION) * rate.value
-        return quantity_decimal * rate.value
+    def _compute_cost(*, quantity: int, rate: Rate) -> int:
+        """Return the exact cost in units of ``10 ** -rate.scale``."""
+        return quantity * rate.units
 
     @staticmethod
-    def _to_fixed_6(value: Decimal) -> str:
-        quantized = value.quantize(COST_QUANTIZER, rounding=ROUND_HALF_UP)
-        return format(quantized, "f")
+    def _to_fixed_6(units: int, scale: int) -> str:
+        """Round ``units * 10 ** -scale`` half-up to six decimal places."""
+        magnitude = abs(units)
+        excess = scale - COST_SCALE
+        if excess <= 0:
+            micros = magnitude * 10**-excess
+        elif magnitude.bit_length() <= 3 * (excess - 1):
+            # magnitude < 8 ** (excess - 1) <= 10 ** excess / 2, so it
+            # rounds to zero without building the divisor.
+            micros = 0
+        else:
+            divisor = 10**excess
+            micros = (magnitude + divisor // 2) // divisor
+        whole, fraction = divmod(micros, 10**COST_SCALE)
+        sign = "-" if units < 0 else ""
+        return f"{sign}{whole}.{fraction:06d}"
 
     @staticmethod
     def _validate_mode(mode: str) -> None:
@@ -220,7 +324,7 @@ class BillingEngine:
             )
 
     def _validate_pricing_version(self, pricing_version: str) -> None:
-        if pricing_version in {"latest", self._repository.pricing_version}:
+        if pricing_version in self._valid_pricing_versions:
             return
         raise PricingError(
             "PRICING_VERSION_NOT_FOUND",
@@ -231,21 +335,22 @@ class BillingEngine:
     @staticmethod
     def _validate_usage(usage: dict[str, int]) -> None:
         for dimension, quantity in usage.items():
-            if not isinstance(dimension, str) or not dimension:
+            # Exact type checks: no MRO walk, and bool is excluded for free.
+            if type(dimension) is not str or not dimension:
                 raise PricingError(
                     "INVALID_REQUEST",
                     "Usage dimensions must be non-empty strings",
                     details={"dimension": dimension},
                 )
 
-            if isinstance(quantity, bool) or not isinstance(quantity, int):
+            if type(quantity) is not int:
                 raise PricingError(
                     "INVALID_REQUEST",
                     "Usage quantities must be integers",
                     details={"dimension": dimension, "quantity": quantity},
                 )
 
-            if quantity < 0 or quantity > MAX_DIMENSION_QUANTITY:
+            if not 0 <= quantity <= MAX_DIMENSION_QUANTITY:
                 raise PricingError(
                     "INVALID_REQUEST",
                     "Usage quantity out of range",
@@ -1,31 +1,37 @@
 from __future__ import annotations
 
-import json
 import logging
-from datetime import UTC, datetime
+
+import orjson
+
+from app.clock import iso_now
+
+_EXTRA_KEYS = (
+    "event",
+    "provider",
+    "model",
+    "status_code",
+    "error_code",
+    "request_id",
+)
 
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Serialize a log record as a compact JSON string."""
         payload: dict[str, object] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": iso_now(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
-        keys = (
-            "event",
-            "provider",
-            "model",
-            "status_code",
-            "error_code",
-            "request_id",
-        )
-        for key in keys:
-            if hasattr(record, key):
-                payload[key] = getattr(record, key)
-        return json.dumps(payload, separators=(",", ":"))
+        # ``extra=`` fields land in the record's ``__dict__``; probing it
+        # directly avoids a getattr per key, and the tuple keeps key order.
+        attributes = record.__dict__
+        for key in _EXTRA_KEYS:
+            if key in attributes:
+                payload[key] = attributes[key]
+        return orjson.dumps(payload).decode()
 
 
 def configure_logging() -> None:
@@ -6,6 +6,7 @@ from typing import Any, AsyncIterator, cast
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from starlette.routing import Route
 
 from app import __version__
 from app.api.errors import (
@@ -13,8 +14,9 @@ from app.api.errors import (
     pricing_error_handler,
     validation_error_handler,
 )
+from app.api.health import HEALTHZ_PATH, HealthCheck
 from app.api.middleware import BodySizeLimitMiddleware, RequestIdMiddleware
-from app.api.routes import router
+from app.api.routes import create_router
 from app.constants import MAX_REQUEST_BODY_BYTES
 from app.engine import BillingEngine, PricingError
 from app.logging import configure_logging
@@ -44,15 +46,20 @@ def create_app() -> FastAPI:
     repository = PricingRepository()
     engine = BillingEngine(repository=repository, engine_version=__version__)
 
-    app.state.repository = repository
-    app.state.engine = engine
-
     app.add_middleware(RequestIdMiddleware)
     app.add_middleware(
         BodySizeLimitMiddleware,
         max_body_bytes=MAX_REQUEST_BODY_BYTES,
     )
-    app.include_router(router)
+    app.include_router(create_router(repository=repository, engine=engine))
+    app.router.routes.append(
+        Route(
+            HEALTHZ_PATH,
+            endpoint=HealthCheck(repository=repository, engine=engine),
+            methods=["GET"],
+            include_in_schema=False,
+        )
+    )
 
     app.add_exception_handler(PricingError, cast(Any, pricing_error_handler))
     app.add_exception_handler(
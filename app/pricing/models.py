@@ -1,20 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Literal
 
+from app.constants import MAX_RATE_DIGITS, MAX_RATE_EXPONENT
+
 RateKind = Literal["per_1m", "per_unit"]
 
 
-@dataclass(frozen=True)
+def check_rate_bounds(value: Decimal) -> Decimal:
+    """Reject finite rates whose digits or exponent exceed the limits."""
+    _, digits, exponent = value.as_tuple()
+    assert isinstance(exponent, int)
+    if (
+        len(digits) > MAX_RATE_DIGITS
+        or not -MAX_RATE_EXPONENT <= exponent <= MAX_RATE_EXPONENT
+    ):
+        raise ValueError(
+            f"Rate must have at most {MAX_RATE_DIGITS} digits and an "
+            f"exponent between -{MAX_RATE_EXPONENT} and {MAX_RATE_EXPONENT}"
+        )
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class Rate:
     kind: RateKind
     value: Decimal
     raw: str
+    # ``value`` as an exact integer factor: ``quantity * units`` is the cost
+    # in units of ``10 ** -scale`` of the currency (per_1m folded in).
+    units: int = field(init=False, repr=False, compare=False)
+    scale: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the integer cost factor used by the billing engine."""
+        if not self.value.is_finite():
+            raise ValueError(f"Rate value must be finite, got {self.raw!r}")
+        check_rate_bounds(self.value)
 
+        sign, digits, exponent = self.value.as_tuple()
+        assert isinstance(exponent, int)
+        units = int("".join(map(str, digits)))
+        if sign:
+            units = -units
+        if exponent > 0:
+            units *= 10**exponent
+        scale = max(-exponent, 0)
+        if self.kind == "per_1m":
+            scale += 6
 
-@dataclass(frozen=True)
+        object.__setattr__(self, "units", units)
+        object.__setattr__(self, "scale", scale)
+
+
+@dataclass(frozen=True, slots=True)
 class TierCondition:
     # any usage key, or "context_tokens" (= input_uncached + input_cached)
     dimension: str
@@ -22,13 +63,13 @@ class TierCondition:
     gt: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PricingTier:
     condition: TierCondition
     billable: dict[str, Rate]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelPricing:
     model: str
     effective_from: str
@@ -36,16 +77,37 @@ class ModelPricing:
     capabilities: tuple[str, ...]
     metadata: dict[str, Any]
     pricing_tiers: tuple[PricingTier, ...]
+    # ``pricing_tiers`` by descending threshold, the order the engine
+    # checks them in; ``pricing_tiers`` itself keeps the registry order.
+    tiers_by_threshold: tuple[PricingTier, ...] = field(
+        init=False, repr=False, compare=False
+    )
 
+    def __post_init__(self) -> None:
+        """Pre-sort tiers so tier selection needs no per-request sort."""
+        object.__setattr__(
+            self,
+            "tiers_by_threshold",
+            tuple(
+                sorted(
+                    self.pricing_tiers,
+                    key=lambda tier: tier.condition.gt,
+                    reverse=True,
+                )
+            ),
+        )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProviderPricing:
     provider: str
     models: dict[str, ModelPricing]
     source: dict[str, Any]
+    # sorted union of model capabilities, computed once at load time
+    capabilities: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegistryMeta:
     pricing_version: str
     published_at: str
@@ -1,35 +1,65 @@
 from __future__ import annotations
 
-import json
+import functools
+import sys
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+import orjson
 from jsonschema import Draft202012Validator
 
 from app.pricing import models as pricing_models
 from app.pricing.models import PricingTier, TierCondition
 
+# Rates are immutable, so identical (kind, raw) rates across every loaded
+# model and tier share one instance.
+_RATE_POOL: dict[tuple[str, str], pricing_models.Rate] = {}
+
+
+@functools.cache
+def _compile_validator(schema_path: Path) -> Draft202012Validator:
+    """Check a schema file and build its validator once per process."""
+    schema = orjson.loads(schema_path.read_bytes())
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
 
 class PricingRepository:
-    def __init__(self, root_dir: Path | None = None) -> None:
-        """Initialize repository paths, validators, and lazy caches."""
+    def __init__(
+        self,
+        root_dir: Path | None = None,
+        *,
+        lazy: bool = False,
+    ) -> None:
+        """Initialize repository paths, validators, and provider caches.
+
+        Unless ``lazy`` is set, every provider file is parsed and validated
+        up front so no request pays for a cold provider load.
+        """
         self._root_dir = root_dir or Path(__file__).resolve().parents[2]
         self._pricing_dir = self._root_dir / "pricing"
         self._schema_dir = self._root_dir / "schema"
 
-        self._provider_validator = Draft202012Validator(
-            self._read_json(self._schema_dir / "pricing_provider.schema.json")
+        self._provider_validator = _compile_validator(
+            self._schema_dir / "pricing_provider.schema.json"
+        )
+        self._meta_validator = _compile_validator(
+            self._schema_dir / "pricing_registry_meta.schema.json"
         )
-        meta_schema = self._schema_dir / "pricing_registry_meta.schema.json"
-        meta_schema_payload = self._read_json(meta_schema)
-        self._meta_validator = Draft202012Validator(meta_schema_payload)
 
         self._meta = self._load_meta()
         self._provider_files = self._discover_providers()
         self._provider_cache: dict[str, pricing_models.ProviderPricing] = {}
-        self._model_aliases: dict[str, dict[str, str]] | None = None
-        self._provider_aliases: dict[str, str] | None = None
+        self._model_aliases, self._provider_aliases = self._load_aliases()
+        self._model_table: (
+            dict[tuple[str, str], pricing_models.ModelPricing] | None
+        ) = None
+
+        if not lazy:
+            for provider, path in self._provider_files.items():
+                self._provider_cache[provider] = self._load_provider(path)
+            self._model_table = self._build_model_table()
 
     @property
     def pricing_version(self) -> str:
@@ -70,27 +100,12 @@ class PricingRepository:
 
     def resolve_provider(self, provider: str) -> str:
         """Resolve provider alias chains to a canonical provider key."""
-        aliases = self._get_provider_aliases()
-        origin = provider
-        resolved = provider
-        visited: set[str] = set()
-
-        while True:
-            if resolved in visited:
-                return origin
-            visited.add(resolved)
-
-            next_provider = aliases.get(resolved)
-            if next_provider is None:
-                return resolved
-
-            resolved = next_provider
+        return self._provider_aliases.get(provider, provider)
 
     def resolve_model(self, provider: str, model: str) -> str:
         """Resolve a model alias within a provider namespace."""
-        aliases = self._get_model_aliases()
         canonical_provider = self.resolve_provider(provider)
-        provider_aliases = aliases.get(canonical_provider, {})
+        provider_aliases = self._model_aliases.get(canonical_provider, {})
         return provider_aliases.get(model, model)
 
     def get_model(
@@ -99,11 +114,15 @@ class PricingRepository:
         model: str,
     ) -> pricing_models.ModelPricing | None:
         """Get model pricing by provider/model, including alias resolution."""
+        if self._model_table is not None:
+            return self._model_table.get((provider, model))
+
+        # Lazy repositories resolve on demand, which is also the reference
+        # behaviour the eager table is built to reproduce.
         provider_data = self.get_provider(provider)
         if not provider_data:
             return None
-        resolved = self.resolve_model(provider, model)
-        return provider_data.models.get(resolved)
+        return provider_data.models.get(self.resolve_model(provider, model))
 
     def list_models(self, provider: str) -> list[pricing_models.ModelPricing]:
         """List all models for a provider sorted by model id."""
@@ -164,10 +183,18 @@ class PricingRepository:
         )
 
         models = self._parse_models(raw["models"], provider_path.name)
+        capabilities = sorted(
+            {
+                capability
+                for model in models.values()
+                for capability in model.capabilities
+            }
+        )
         return pricing_models.ProviderPricing(
             provider=raw["provider"],
             models=models,
             source=raw.get("source", {}),
+            capabilities=tuple(capabilities),
         )
 
     def _parse_models(
@@ -181,7 +208,9 @@ class PricingRepository:
             tiers = [
                 PricingTier(
                     condition=TierCondition(
-                        dimension=raw_tier["condition"]["dimension"],
+                        dimension=sys.intern(
+                            raw_tier["condition"]["dimension"]
+                        ),
                         gt=raw_tier["condition"]["gt"],
                     ),
                     billable=self._parse_billable(raw_tier["billable"]),
@@ -192,7 +221,9 @@ class PricingRepository:
                 model=raw_model["model"],
                 effective_from=raw_model["effective_from"],
                 billable=billable,
-                capabilities=tuple(raw_model.get("capabilities", [])),
+                capabilities=tuple(
+                    map(sys.intern, raw_model.get("capabilities", []))
+                ),
                 metadata=raw_model.get("metadata", {}),
                 pricing_tiers=tuple(tiers),
             )
@@ -202,6 +233,25 @@ class PricingRepository:
             models[entry.model] = entry
         return models
 
+    def _build_model_table(
+        self,
+    ) -> dict[tuple[str, str], pricing_models.ModelPricing]:
+        """Map every provider/model spelling, aliases included, to pricing."""
+        table: dict[tuple[str, str], pricing_models.ModelPricing] = {}
+        for provider in (*self._provider_files, *self._provider_aliases):
+            canonical_provider = self.resolve_provider(provider)
+            provider_data = self._provider_cache.get(canonical_provider)
+            if provider_data is None:
+                continue
+            aliases = self._model_aliases.get(canonical_provider, {})
+            for model in (*provider_data.models, *aliases):
+                model_data = provider_data.models.get(
+                    aliases.get(model, model)
+                )
+                if model_data is not None:
+                    table[(provider, model)] = model_data
+        return table
+
     @staticmethod
     def _parse_billable(
         raw_billable: dict[str, Any],
@@ -212,56 +262,60 @@ class PricingRepository:
                 kind, raw_value = "per_1m", str(raw_rate["per_1m"])
             else:
                 kind, raw_value = "per_unit", str(raw_rate["per_unit"])
-            billable[dimension] = pricing_models.Rate(
-                kind=kind, value=Decimal(raw_value), raw=raw_value
-            )
+            rate = _RATE_POOL.get((kind, raw_value))
+            if rate is None:
+                rate = pricing_models.Rate(
+                    kind=kind, value=Decimal(raw_value), raw=raw_value
+                )
+                _RATE_POOL[(kind, raw_value)] = rate
+            billable[sys.intern(dimension)] = rate
         return billable
 
-    def _get_model_aliases(self) -> dict[str, dict[str, str]]:
-        if self._model_aliases is None:
-            self._model_aliases = self._load_model_aliases()
-        return self._model_aliases
-
-    def _load_model_aliases(self) -> dict[str, dict[str, str]]:
-        aliases: dict[str, dict[str, str]] = {}
+    def _load_aliases(
+        self,
+    ) -> tuple[dict[str, dict[str, str]], dict[str, str]]:
+        """Read model and provider aliases from one pass over alias files."""
+        model_aliases: dict[str, dict[str, str]] = {}
+        provider_aliases: dict[str, str] = {}
         aliases_dir = self._pricing_dir / "aliases"
 
         for alias_path in sorted(aliases_dir.glob("*.json")):
             raw = self._read_json(alias_path)
+
             provider = raw.get("provider")
             mapping = raw.get("aliases", {})
-
             if isinstance(provider, str) and isinstance(mapping, dict):
-                provider_aliases: dict[str, str] = {}
-                for alias, canonical in mapping.items():
-                    provider_aliases[str(alias)] = str(canonical)
-                aliases[provider] = provider_aliases
-
-        return aliases
-
-    def _get_provider_aliases(self) -> dict[str, str]:
-        if self._provider_aliases is None:
-            self._provider_aliases = self._load_provider_aliases()
-        return self._provider_aliases
+                model_aliases[provider] = {
+                    str(alias): str(canonical)
+                    for alias, canonical in mapping.items()
+                }
 
-    def _load_provider_aliases(self) -> dict[str, str]:
-        aliases: dict[str, str] = {}
-        aliases_dir = self._pricing_dir / "aliases"
-
-        for alias_path in sorted(aliases_dir.glob("*.json")):
-            raw = self._read_json(alias_path)
             mapping = raw.get("provider_aliases", {})
-            if not isinstance(mapping, dict):
-                continue
+            if isinstance(mapping, dict):
+                for alias, canonical in mapping.items():
+                    provider_aliases[str(alias)] = str(canonical)
 
-            for alias, canonical in mapping.items():
-                aliases[str(alias)] = str(canonical)
+        return model_aliases, self._flatten_alias_chains(provider_aliases)
 
-        return aliases
+    @staticmethod
+    def _flatten_alias_chains(aliases: dict[str, str]) -> dict[str, str]:
+        """Map every alias straight to the end of its chain.
+
+        An alias whose chain loops back on itself resolves to itself.
+        """
+        flattened: dict[str, str] = {}
+        for origin in aliases:
+            resolved = origin
+            visited: set[str] = set()
+            while resolved in aliases and resolved not in visited:
+                visited.add(resolved)
+                resolved = aliases[resolved]
+            flattened[origin] = origin if resolved in visited else resolved
+        return flattened
 
     @staticmethod
     def _read_json(path: Path) -> dict[str, Any]:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
 
     @staticmethod
     def _validate_schema(
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from fastapi.testclient import TestClient
+from typing import TYPE_CHECKING, Iterator
 
-from app.main import app
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
 
-client = TestClient(app)
 
-
-def test_estimate_endpoint() -> None:
+def test_estimate_endpoint(client: TestClient) -> None:
     """Return a deterministic estimate for a valid request payload."""
     response = client.post(
         "/v1/estimate",
@@ -29,7 +28,7 @@ def test_estimate_endpoint() -> None:
     assert payload["total"]["cost"] == "0.002240"
 
 
-def test_estimate_endpoint_with_provider_alias() -> None:
+def test_estimate_endpoint_with_provider_alias(client: TestClient) -> None:
     """Support provider aliases on the single estimate endpoint."""
     response = client.post(
         "/v1/estimate",
@@ -49,7 +48,9 @@ def test_estimate_endpoint_with_provider_alias() -> None:
     assert payload["total"]["cost"] == "3.000000"
 
 
-def test_estimate_endpoint_strict_unsupported_dimension() -> None:
+def test_estimate_endpoint_strict_unsupported_dimension(
+    client: TestClient,
+) -> None:
     """Return validation errors for unsupported dimensions in strict mode."""
     response = client.post(
         "/v1/estimate",
@@ -67,7 +68,7 @@ def test_estimate_endpoint_strict_unsupported_dimension() -> None:
     assert payload["error"]["code"] == "UNSUPPORTED_DIMENSION"
 
 
-def test_batch_endpoint_partial_success() -> None:
+def test_batch_endpoint_partial_success(client: TestClient) -> None:
     """Return mixed success and error entries for batch estimates."""
     response = client.post(
         "/v1/estimate/batch",
@@ -99,7 +100,7 @@ def test_batch_endpoint_partial_success() -> None:
     assert payload["errors"][0]["error"]["code"] == "MODEL_NOT_FOUND"
 
 
-def test_models_endpoint_with_rates() -> None:
+def test_models_endpoint_with_rates(client: TestClient) -> None:
     """Include billable rate details when `include_rates=true`."""
     response = client.get(
         "/v1/models", params={"provider": "openai", "include_rates": "true"}
@@ -112,7 +113,24 @@ def test_models_endpoint_with_rates() -> None:
     assert "billable" in payload["models"][0]
 
 
-def test_models_endpoint_with_provider_alias() -> None:
+def test_models_endpoint_caches_each_variant(client: TestClient) -> None:
+    """Serve cached listings per provider and `include_rates` variant."""
+    responses = [
+        client.get(
+            "/v1/models",
+            params={"provider": "anthropic", "include_rates": include_rates},
+        )
+        for include_rates in ("true", "false", "true", "false")
+    ]
+
+    bodies = [response.json() for response in responses]
+    assert all(r.status_code == 200 for r in responses)
+    assert bodies[0] == bodies[2] and bodies[1] == bodies[3]
+    assert all(m["billable"] for m in bodies[0]["models"])
+    assert all(m["billable"] is None for m in bodies[1]["models"])
+
+
+def test_models_endpoint_with_provider_alias(client: TestClient) -> None:
     """Support provider aliases on the models listing endpoint."""
     response = client.get("/v1/models", params={"provider": "bedrock"})
 
@@ -125,16 +143,19 @@ def test_models_endpoint_with_provider_alias() -> None:
     )
 
 
-def test_versions_endpoint() -> None:
+def test_versions_endpoint(client: TestClient) -> None:
     """Return the active pricing version from metadata."""
     response = client.get("/v1/versions")
 
     assert response.status_code == 200
     payload = response.json()
     assert payload == {"pricing_version": "2026-03-25"}
+    assert response.headers["cache-control"] == "public, max-age=60"
 
 
-def test_providers_endpoint_contains_expanded_registry() -> None:
+def test_providers_endpoint_contains_expanded_registry(
+    client: TestClient,
+) -> None:
     """List the expected base and extended provider set."""
     response = client.get("/v1/providers")
 
@@ -147,7 +168,7 @@ def test_providers_endpoint_contains_expanded_registry() -> None:
     assert {"mistral", "together"}.issubset(providers)
 
 
-def test_estimate_with_override_ratecard() -> None:
+def test_estimate_with_override_ratecard(client: TestClient) -> None:
     """Apply override pricing ratecards when provided in request."""
     response = client.post(
         "/v1/estimate",
@@ -171,7 +192,121 @@ def test_estimate_with_override_ratecard() -> None:
     assert payload["total"]["cost"] == "1.000000"
 
 
-def test_estimate_empty_usage_rejected() -> None:
+def test_batch_override_ratecards_keep_their_raw_rates(
+    client: TestClient,
+) -> None:
+    """Echo each item's own override rate even when values compare equal."""
+
+    def item(rate: str) -> dict[str, object]:
+        return {
+            "provider": "openai",
+            "model": "gpt-4.1-mini",
+            "usage": {"input_tokens_uncached": 1_000_000},
+            "overrides": {
+                "ratecard": {
+                    "billable": {"input_tokens_uncached": {"per_1m": rate}},
+                }
+            },
+        }
+
+    response = client.post(
+        "/v1/estimate/batch",
+        json={"items": [item("1.0"), item("1"), item("1.0"), item("1e0")]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    rates = [r["breakdown"][0]["rate"] for r in results]
+    assert rates == ["1.0", "1", "1.0", "1"]
+    assert {r["total"]["cost"] for r in results} == {"1.000000"}
+
+
+def test_invalid_override_rate_rejected(client: TestClient) -> None:
+    """Return a 400 envelope for validator errors raised on override rates."""
+    response = client.post(
+        "/v1/estimate",
+        json={
+            "provider": "openai",
+            "model": "gpt-4.1-mini",
+            "usage": {"input_tokens_uncached": 1_000_000},
+            "overrides": {
+                "ratecard": {
+                    "billable": {"input_tokens_uncached": {"per_1m": "-1"}},
+                }
+            },
+        },
+    )
+
+    assert response.status_code == 400
+    error = response.json()["error"]
+    assert error["code"] == "INVALID_REQUEST"
+    # One error, located at the rate field the client sent.
+    errors = error["details"]["validation_errors"]
+    assert [(e["loc"], e["msg"]) for e in errors] == [
+        (
+            [
+                "body",
+                "overrides",
+                "ratecard",
+                "billable",
+                "input_tokens_uncached",
+                "per_1m",
+                "per_1m",
+            ],
+            "Input should be greater than or equal to 0",
+        )
+    ]
+
+
+def test_override_rate_accepts_explicit_null(client: TestClient) -> None:
+    """Treat an explicit null rate field as unset."""
+    response = client.post(
+        "/v1/estimate",
+        json={
+            "provider": "openai",
+            "model": "gpt-4.1-mini",
+            "usage": {"input_tokens_uncached": 1_000_000},
+            "overrides": {
+                "ratecard": {
+                    "billable": {
+                        "input_tokens_uncached": {
+                            "per_1m": None,
+                            "per_unit": "0.000002",
+                        }
+                    },
+                }
+            },
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total"]["cost"] == "2.000000"
+
+
+def test_override_rate_exponent_bounds(client: TestClient) -> None:
+    """Reject override rates with extreme exponents or digit counts."""
+    for rate in ("1e-2000000", "1e5000", "1" * 5000, "1e-31"):
+        response = client.post(
+            "/v1/estimate",
+            json={
+                "provider": "openai",
+                "model": "gpt-4.1-mini",
+                "usage": {"input_tokens_uncached": 1_000_000},
+                "overrides": {
+                    "ratecard": {
+                        "billable": {
+                            "input_tokens_uncached": {"per_1m": rate}
+                        },
+                    }
+                },
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_estimate_empty_usage_rejected(client: TestClient) -> None:
     """Reject estimate requests with an empty usage payload."""
     response = client.post(
         "/v1/estimate",
@@ -186,7 +321,59 @@ def test_estimate_empty_usage_rejected() -> None:
     assert response.json()["error"]["code"] == "INVALID_REQUEST"
 
 
-def test_models_endpoint_unknown_provider() -> None:
+def test_estimate_non_integer_quantity_rejected(client: TestClient) -> None:
+    """Reject booleans and numeric strings as usage quantities."""
+    for quantity in (True, "1000", 10.0):
+        response = client.post(
+            "/v1/estimate",
+            json={
+                "provider": "openai",
+                "model": "gpt-4.1-mini",
+                "usage": {"input_tokens_uncached": quantity},
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_oversized_integer_input_rejected(client: TestClient) -> None:
+    """Echo integers beyond 64 bits in a 400 envelope, not a 500."""
+    base = {
+        "provider": "openai",
+        "model": "gpt-4.1-mini",
+        "usage": {"input_tokens_uncached": 10},
+    }
+    payloads = [
+        {**base, "provider": 2**64},
+        {**base, "extra": 2**64},
+        {**base, "usage": {"input_tokens_uncached": 2**64}},
+    ]
+    for payload in payloads:
+        response = client.post("/v1/estimate", json=payload)
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_override_unsupported_dimension_rejected(client: TestClient) -> None:
+    """Reject empty override maps and unsupported override dimensions."""
+    for billable in ({}, {"gpu_seconds": {"per_unit": "1"}}):
+        response = client.post(
+            "/v1/estimate",
+            json={
+                "provider": "openai",
+                "model": "gpt-4.1-mini",
+                "usage": {"input_tokens_uncached": 1},
+                "overrides": {"ratecard": {"billable": billable}},
+            },
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_models_endpoint_unknown_provider(client: TestClient) -> None:
     """Return provider-not-supported for unknown provider names."""
     response = client.get("/v1/models", params={"provider": "nonexistent"})
 
@@ -195,7 +382,7 @@ def test_models_endpoint_unknown_provider() -> None:
     assert payload["error"]["code"] == "PROVIDER_NOT_SUPPORTED"
 
 
-def test_internal_error_does_not_leak_details() -> None:
+def test_internal_error_does_not_leak_details(client: TestClient) -> None:
     """Ensure internal errors do not expose sensitive details fields."""
     response = client.get("/v1/models", params={"provider": "nonexistent"})
     if response.status_code == 500:
@@ -203,7 +390,7 @@ def test_internal_error_does_not_leak_details() -> None:
         assert "reason" not in payload["error"].get("details", {})
 
 
-def test_model_detail_endpoint() -> None:
+def test_model_detail_endpoint(client: TestClient) -> None:
     """Return full model details for a valid provider/model pair."""
     response = client.get("/v1/models/openai/gpt-4.1-mini")
 
@@ -217,7 +404,7 @@ def test_model_detail_endpoint() -> None:
     assert isinstance(payload["pricing_tiers"], list)
 
 
-def test_model_detail_endpoint_not_found() -> None:
+def test_model_detail_endpoint_not_found(client: TestClient) -> None:
     """Return MODEL_NOT_FOUND for unknown model."""
     response = client.get("/v1/models/openai/does-not-exist")
 
@@ -226,7 +413,7 @@ def test_model_detail_endpoint_not_found() -> None:
     assert payload["error"]["code"] == "MODEL_NOT_FOUND"
 
 
-def test_model_detail_endpoint_with_provider_alias() -> None:
+def test_model_detail_endpoint_with_provider_alias(client: TestClient) -> None:
     """Resolve provider aliases when fetching model details."""
     response = client.get("/v1/models/grok/grok-4")
 
@@ -236,7 +423,7 @@ def test_model_detail_endpoint_with_provider_alias() -> None:
     assert "billable" in payload
 
 
-def test_body_size_limit() -> None:
+def test_body_size_limit(client: TestClient) -> None:
     """Reject payloads larger than the configured request body limit."""
     response = client.post(
         "/v1/estimate",
@@ -247,3 +434,44 @@ def test_body_size_limit() -> None:
     assert response.status_code == 413
     payload = response.json()
     assert payload["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_body_size_limit_without_content_length(client: TestClient) -> None:
+    """Reject streamed payloads that exceed the body limit mid-request."""
+
+    def chunks() -> Iterator[bytes]:
+        for _ in range(3):
+            yield b"x" * 524_288
+
+    response = client.post(
+        "/v1/estimate",
+        content=chunks(),
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 413
+    payload = response.json()
+    assert payload["error"]["code"] == "INVALID_REQUEST"
+
+
+def test_request_id_is_echoed(client: TestClient) -> None:
+    """Echo an inbound request ID and generate one when it is missing."""
+    response = client.get("/v1/versions", headers={"X-Request-Id": "abc123"})
+    assert response.headers["X-Request-Id"] == "abc123"
+
+    response = client.get("/v1/models/openai/does-not-exist")
+    assert response.headers["X-Request-Id"]
+
+
+def test_healthz_endpoint(client: TestClient) -> None:
+    """Report readiness with the active pricing and engine versions."""
+    response = client.get("/v1/healthz")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["X-Request-Id"]
+    assert response.json() == {
+        "status": "ok",
+        "pricing_version": "2026-03-25",
+        "engine_version": "0.1.0",
+    }
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from decimal import Decimal
+import functools
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -13,8 +15,9 @@ from app.pricing.repository import PricingRepository
 ROOT_DIR = Path(__file__).resolve().parents[1]
 
 
+@functools.cache
 def make_engine() -> BillingEngine:
-    """Create a billing engine bound to the local test registry."""
+    """Create a billing engine bound to the local test registry, once."""
     repository = PricingRepository(root_dir=ROOT_DIR)
     return BillingEngine(repository=repository, engine_version="0.1.0")
 
@@ -78,6 +81,22 @@ def test_provider_alias_resolution_for_aws_bedrock() -> None:
     assert result.total_cost == "0.600000"
 
 
+def test_eager_model_table_matches_lazy_resolution() -> None:
+    """Resolve every provider/model spelling alike when eager or lazy."""
+    eager = PricingRepository(root_dir=ROOT_DIR)
+    lazy = PricingRepository(root_dir=ROOT_DIR, lazy=True)
+    table = eager._model_table
+    assert table
+
+    providers = {provider for provider, _ in table} | {"unknown"}
+    models = {model for _, model in table} | {"unknown"}
+    for provider in providers:
+        for model in models:
+            assert eager.get_model(provider, model) == lazy.get_model(
+                provider, model
+            ), (provider, model)
+
+
 def test_unsupported_dimension_in_strict_mode() -> None:
     """Raise an error on unsupported dimensions in strict mode."""
     engine = make_engine()
@@ -139,6 +158,67 @@ def test_override_ratecard_bypasses_registry_lookup() -> None:
     assert result.total_cost == "2.500000"
 
 
+def test_integer_costs_match_decimal_reference() -> None:
+    """Keep fixed-point costs identical to half-up Decimal rounding."""
+    engine = make_engine()
+    rates = ("0", "0.0000005", "0.075", "1.25", "3E+1", "0.1234567")
+    quantities = (0, 1, 499_999, 1_000_001, 10_000_000_000)
+
+    for raw in rates:
+        override = OverrideRatecard(
+            currency="USD",
+            billable={
+                "input_tokens_uncached": Rate(
+                    kind="per_1m",
+                    value=Decimal(raw),
+                    raw=raw,
+                ),
+                "tool_calls": Rate(
+                    kind="per_unit",
+                    value=Decimal(raw),
+                    raw=raw,
+                ),
+            },
+        )
+        for quantity in quantities:
+            result = engine.estimate(
+                provider="custom",
+                model="custom-model",
+                usage={"input_tokens_uncached": quantity, "tool_calls": 3},
+                override_ratecard=override,
+            )
+
+            expected = (
+                quantity * Decimal(raw) / Decimal(1_000_000) + 3 * Decimal(raw)
+            ).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+            assert result.total_cost == format(expected, "f")
+
+
+def test_rate_exponent_bounds() -> None:
+    """Price rates at the exponent bounds and reject those beyond them."""
+    engine = make_engine()
+    for raw, expected in (("1e-30", "0"), ("1e30", "1" + "0" * 36)):
+        override = OverrideRatecard(
+            currency="USD",
+            billable={
+                "tool_calls": Rate(
+                    kind="per_unit", value=Decimal(raw), raw=raw
+                ),
+            },
+        )
+        result = engine.estimate(
+            provider="custom",
+            model="custom-model",
+            usage={"tool_calls": 1_000_000},
+            override_ratecard=override,
+        )
+        assert result.total_cost == f"{expected}.000000"
+
+    for raw in ("1e-31", "1e31", "1" * 31):
+        with pytest.raises(ValueError):
+            Rate(kind="per_1m", value=Decimal(raw), raw=raw)
+
+
 def test_pricing_version_not_found() -> None:
     """Reject pricing versions that are not present."""
     engine = make_engine()
@@ -154,6 +234,22 @@ def test_pricing_version_not_found() -> None:
     assert exc_info.value.code == "PRICING_VERSION_NOT_FOUND"
 
 
+def test_usage_rejects_non_int_quantities() -> None:
+    """Reject bool, float and out-of-range usage quantities."""
+    engine = make_engine()
+
+    for quantity in (True, 1.0, -1, 10_000_000_001):
+        usage: dict[str, Any] = {"input_tokens_uncached": quantity}
+        with pytest.raises(PricingError) as exc_info:
+            engine.estimate(
+                provider="openai",
+                model="gpt-4.1-mini",
+                usage=usage,
+            )
+
+        assert exc_info.value.code == "INVALID_REQUEST"
+
+
 def test_gemini_context_tier_below_threshold() -> None:
     """Use base rates when context is within the <=200k tier."""
     engine = make_engine()
@@ -220,3 +316,41 @@ def test_gemini_context_tier_cached_counts_toward_context() -> None:
     # = 0.375 + 0.0625 = 0.437500
     assert result.total_cost == "0.437500"
     assert any("pricing tier applied" in w.lower() for w in result.warnings)
+
+
+def test_estimate_many_matches_single_estimates() -> None:
+    """Return per-usage outcomes matching what `estimate` would produce."""
+    engine = make_engine()
+
+    outcomes = engine.estimate_many(
+        provider="google",
+        model="gemini-2.5-pro",
+        usages=[
+            {"input_tokens_uncached": 100_000, "output_tokens": 500},
+            {"input_tokens_uncached": 300_000, "output_tokens": 500},
+            {"reasoning_tokens": 10, "unknown_dimension": 1},
+        ],
+    )
+
+    assert [getattr(o, "total_cost", None) for o in outcomes[:2]] == [
+        "0.130000",
+        "0.757500",
+    ]
+    assert isinstance(outcomes[2], PricingError)
+    assert outcomes[2].code == "UNSUPPORTED_DIMENSION"
+
+
+def test_estimate_many_reports_usage_errors_before_lookup_errors() -> None:
+    """Keep `estimate` error precedence when the model does not exist."""
+    engine = make_engine()
+
+    outcomes = engine.estimate_many(
+        provider="openai",
+        model="does-not-exist",
+        usages=[{"input_tokens_uncached": 1}, {"output_tokens": -1}],
+    )
+
+    assert [o.code for o in outcomes if isinstance(o, PricingError)] == [
+        "MODEL_NOT_FOUND",
+        "INVALID_REQUEST",
+    ]